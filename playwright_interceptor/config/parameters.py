@@ -10,3 +10,11 @@ UNSUPPORTED_PROTOCOLS = (
     'safari-web-extension:',
     'edge-extension:',
 )
+
+# Playwright resource types passed through untouched when ignore_assets is set
+ASSET_RESOURCE_TYPES = frozenset({
+    'image',
+    'font',
+    'stylesheet',
+    'media',
+})
@@ -88,6 +88,12 @@ def parse_response_data(data: Union[str, bytes], content_type: str) -> Union[dic
             else:
                 text_data = data
             
+            # Most responses are clean JSON - decode directly, without prefix scan
+            try:
+                return json.loads(text_data)
+            except json.JSONDecodeError:
+                pass
+
             # Universal CSRF prefix removal
             clean_json = _remove_csrf_prefixes(text_data)
             return json.loads(clean_json)
@@ -8,9 +8,31 @@ from . import config as CFG
 import urllib.parse
 from urllib.parse import urlparse
 from dataclasses import dataclass
+from functools import lru_cache
 from .models import WatcherType, ExpectedContentType
 
 
+# Extensions mapping for each expected content type (ANY matches everything)
+_CONTENT_EXTENSIONS = {
+    ExpectedContentType.JSON: CFG.NETWORK.JSON_EXTENSIONS,
+    ExpectedContentType.JS: CFG.NETWORK.JS_EXTENSIONS,
+    ExpectedContentType.CSS: CFG.NETWORK.CSS_EXTENSIONS,
+    ExpectedContentType.IMAGE: CFG.NETWORK.IMAGE_EXTENSIONS,
+    ExpectedContentType.VIDEO: CFG.NETWORK.VIDEO_EXTENSIONS,
+    ExpectedContentType.AUDIO: CFG.NETWORK.AUDIO_EXTENSIONS,
+    ExpectedContentType.FONT: CFG.NETWORK.FONT_EXTENSIONS,
+    ExpectedContentType.APPLICATION: CFG.NETWORK.APPLICATION_EXTENSIONS,
+    ExpectedContentType.ARCHIVE: CFG.NETWORK.ARCHIVE_EXTENSIONS,
+    ExpectedContentType.TEXT: CFG.NETWORK.TEXT_EXTENSIONS,
+}
+
+
+@lru_cache(maxsize=32)
+def _parse_base_url(base_url: str):
+    """Parses base URL once - it stays the same for every response of an interception"""
+    return urlparse(base_url)
+
+
 @beartype
 @dataclass(frozen=True)
 class Handler:
@@ -77,50 +99,30 @@ class Handler:
     def should_capture(self, resp, base_url: str) -> bool:
         """Определяет, должен ли handler захватить данный response"""
         full_url = urllib.parse.unquote(resp.url)
-        type_data = parse_content_type(resp.headers.get("content-type", ""))
-        ctype = type_data["content_type"]
-
-        def match_method() -> bool:
-            # Проверяем метод запроса
-            return self.method == HttpMethod.ANY or resp.request.method == self.method.value
-
-        def match_content(ctype: str, expected: ExpectedContentType) -> bool:
-            return {
-                ExpectedContentType.JSON: ctype in CFG.NETWORK.JSON_EXTENSIONS,
-                ExpectedContentType.JS: ctype in CFG.NETWORK.JS_EXTENSIONS,
-                ExpectedContentType.CSS: ctype in CFG.NETWORK.CSS_EXTENSIONS,
-                ExpectedContentType.IMAGE: ctype in CFG.NETWORK.IMAGE_EXTENSIONS,
-                ExpectedContentType.VIDEO: ctype in CFG.NETWORK.VIDEO_EXTENSIONS,
-                ExpectedContentType.AUDIO: ctype in CFG.NETWORK.AUDIO_EXTENSIONS,
-                ExpectedContentType.FONT: ctype in CFG.NETWORK.FONT_EXTENSIONS,
-                ExpectedContentType.APPLICATION: ctype in CFG.NETWORK.APPLICATION_EXTENSIONS,
-                ExpectedContentType.ARCHIVE: ctype in CFG.NETWORK.ARCHIVE_EXTENSIONS,
-                ExpectedContentType.TEXT: ctype in CFG.NETWORK.TEXT_EXTENSIONS,
-                ExpectedContentType.ANY: True
-            }[expected]
-        
-        def match_watcher():
-            if self.watcher == WatcherType.ALL:
-                return True
-            else:
-                is_main = (
-                    base_parsed.scheme == resp_parsed.scheme and
-                    base_parsed.netloc == resp_parsed.netloc and
-                    (resp_parsed.path in ['', '/'] or resp_parsed.path == base_parsed.path)
-                )
-                if self.watcher == WatcherType.MAIN:
-                    return is_main
-                else:
-                    return not is_main
-
-        base_parsed = urlparse(base_url)
-        resp_parsed = urlparse(full_url)
-
-        return (self.startswith_url is None or full_url.startswith(self.startswith_url)) and \
-                match_watcher() and \
-                match_method() and \
-                match_content(ctype, self.expected_content)
 
+        # Дешевые проверки идут первыми, разбор URL и content-type - только при необходимости
+        if self.startswith_url is not None and not full_url.startswith(self.startswith_url):
+            return False
+
+        # Проверяем метод запроса
+        if self.method != HttpMethod.ANY and resp.request.method != self.method.value:
+            return False
+
+        if self.watcher != WatcherType.ALL:
+            base_parsed = _parse_base_url(base_url)
+            resp_parsed = urlparse(full_url)
+            is_main = (
+                base_parsed.scheme == resp_parsed.scheme and
+                base_parsed.netloc == resp_parsed.netloc and
+                (resp_parsed.path in ['', '/'] or resp_parsed.path == base_parsed.path)
+            )
+            if is_main != (self.watcher == WatcherType.MAIN):
+                return False
+
+        if self.expected_content == ExpectedContentType.ANY:
+            return True
+        ctype = parse_content_type(resp.headers.get("content-type", ""))["content_type"]
+        return ctype in _CONTENT_EXTENSIONS[self.expected_content]
 
 
 @beartype
@@ -1,5 +1,6 @@
 import logging
 import time
+from contextlib import asynccontextmanager
 from typing import List, Optional, Union
 from .handler import Handler
 from .request_interceptor import MultiRequestInterceptor
@@ -13,33 +14,47 @@ class NetworkInterceptor:
         self.page = page
         self._logger = logger or logging.getLogger(self.__class__.__name__)
 
+    @asynccontextmanager
+    async def _scoped_route(self, url, handler):
+        """Installs route handler for the duration of the block"""
+        await self.page.route(url, handler)
+        try:
+            yield
+        finally:
+            try:
+                await self.page.unroute(url, handler)
+            except Exception as e:
+                self._logger.warning(LOGS.UNROUTE_CLEANUP_ERROR_DIRECT_FETCH.format(error=e))
+
     async def execute(
         self,
         handlers: Union[Handler, List[Handler]],
         timeout: float = 10.0,
+        ignore_assets: bool = False,
+        ignore_unmatched: bool = False,
     ):
         if isinstance(handlers, Handler):
             handlers = [handlers]
 
-        slugs = [h.slug for h in handlers]
-        if len(slugs) != len(set(slugs)):
-            duplicate_slugs = []
-            seen = set()
-            for slug in slugs:
-                if slug in seen:
-                    duplicate_slugs.append(slug)
-                else:
-                    seen.add(slug)
+        seen = set()
+        duplicate_slugs = []
+        for handler in handlers:
+            if handler.slug in seen:
+                duplicate_slugs.append(handler.slug)
+            else:
+                seen.add(handler.slug)
+        if duplicate_slugs:
             raise ValueError(ERR.DUPLICATE_HANDLER_SLUGS.format(duplicate_slugs=duplicate_slugs))
 
-        start_time = time.time()
-        interceptor = MultiRequestInterceptor(self, handlers, self.page.url, start_time)
+        start_time = time.monotonic()
+        interceptor = MultiRequestInterceptor(
+            self,
+            handlers,
+            self.page.url,
+            start_time,
+            ignore_assets=ignore_assets,
+            ignore_unmatched=ignore_unmatched,
+        )
 
-        try:
-            await self.page.route("**/*", interceptor.handle_route)
+        async with self._scoped_route("**/*", interceptor.handle_route):
             return await interceptor.wait_for_results(timeout)
-        finally:
-            try:
-                await self.page.unroute("**/*", interceptor.handle_route)
-            except Exception as e:
-                self._logger.warning(LOGS.UNROUTE_CLEANUP_ERROR_DIRECT_FETCH.format(error=e))
@@ -1,6 +1,8 @@
 import asyncio
+import logging
+import re
 import time
-from beartype import beartype
+import urllib.parse
 from beartype.typing import Union, List, Dict
 from .content_loader import parse_response_data
 from . import config as CFG
@@ -10,7 +12,6 @@ from .execute import ExecuteAction
 from playwright._impl._errors import TargetClosedError
 
 
-@beartype
 class MockResponse:
     def __init__(self, status, headers, url, method):
         self.status = status
@@ -19,15 +20,24 @@ class MockResponse:
         self.request = type('MockRequest', (), {'method': method})()
 
 
-@beartype
 class MultiRequestInterceptor:
     """Class for intercepting HTTP requests with multiple handlers support"""
     
-    def __init__(self, api, handlers: List[Handler], base_url: str, start_time: float):
+    def __init__(
+        self,
+        api,
+        handlers: List[Handler],
+        base_url: str,
+        start_time: float,
+        ignore_assets: bool = False,
+        ignore_unmatched: bool = False,
+    ):
         self.api = api
         self.handlers = handlers
         self.base_url = base_url
         self.start_time = start_time
+        self.ignore_assets = ignore_assets
+        self.ignore_unmatched = ignore_unmatched
         self.rejected_responses = []
         self.loop = asyncio.get_running_loop()
         
@@ -35,10 +45,24 @@ class MultiRequestInterceptor:
         self.handler_results: Dict[str, List[Response]] = {handler.slug: [] for handler in handlers}
         self.handler_errors: Dict[str, HandlerSearchFailed] = {}
         self.handler_modifications: Dict[str, int] = {handler.slug: 0 for handler in handlers}
+
+        # Single regex for URL prefixes of all handlers, None if any handler accepts every URL
+        prefixes = [handler.startswith_url for handler in handlers]
+        if prefixes and None not in prefixes:
+            self._url_match_re = re.compile("|".join(re.escape(prefix) for prefix in prefixes))
+        else:
+            self._url_match_re = None
+
+        # Modifier kinds are fixed for the interceptor lifetime, classify them once
+        self._async_request_modify: Dict[str, bool] = {
+            handler.slug: asyncio.iscoroutinefunction(handler.execute.request_modify) for handler in handlers
+        }
+        self._async_response_modify: Dict[str, bool] = {
+            handler.slug: asyncio.iscoroutinefunction(handler.execute.response_modify) for handler in handlers
+        }
         
         # Future for completion
         self.completion_future = self.loop.create_future()
-        self.timeout_task = None
 
     def _response_to_body(self, response: Response) -> Union[str, bytes]:
         """Converts Response object back to body for Playwright"""
@@ -47,71 +71,105 @@ class MultiRequestInterceptor:
         # Always use content as bytes
         return response.content
     
+    def _can_return(self, handler: Handler) -> bool:
+        """Checks if handler still needs responses to return"""
+        if handler.execute.action not in (ExecuteAction.RETURN, ExecuteAction.ALL):
+            return False
+        return handler.execute.max_responses is None or len(self.handler_results[handler.slug]) < handler.execute.max_responses
+
+    def _can_modify(self, handler: Handler) -> bool:
+        """Checks if handler still has modifications left"""
+        if handler.execute.action not in (ExecuteAction.MODIFY, ExecuteAction.ALL):
+            return False
+        return handler.execute.max_modifications is None or self.handler_modifications[handler.slug] < handler.execute.max_modifications
+
+    def _is_handler_done(self, handler: Handler) -> bool:
+        """Checks if handler has completed all necessary actions"""
+        return not self._can_return(handler) and not self._can_modify(handler)
+
+    def _url_may_match(self, url: str) -> bool:
+        """Checks if URL starts with the prefix of at least one handler"""
+        return self._url_match_re is None or self._url_match_re.match(urllib.parse.unquote(url)) is not None
+
+    @staticmethod
+    def _build_request(request) -> Request:
+        """Creates Request object from original Playwright request"""
+        try:
+            method = HttpMethod(request.method) if request.method != "ANY" else HttpMethod.GET
+        except ValueError:
+            method = HttpMethod.GET
+        
+        # Parse parameters from URL
+        parsed_url = urllib.parse.urlsplit(request.url)
+        params = dict(urllib.parse.parse_qsl(parsed_url.query)) if parsed_url.query else {}
+        
+        # Get request body if exists
+        body = None
+        if hasattr(request, 'post_data') and request.post_data:
+            body = request.post_data
+        
+        return Request(
+            url=request.url,
+            headers=dict(request.headers) if request.headers else {},
+            params=params,
+            body=body,
+            method=method
+        )
+
     async def handle_route(self, route):
         """Route handler for intercepting requests"""
         request = route.request
+        debug_enabled = self.api._logger.isEnabledFor(logging.DEBUG)
         
         # Add explicit logging for each request
-        self.api._logger.debug(f"INTERCEPTOR_HANDLE_ROUTE: URL={request.url}, Method={request.method}")
+        self.api._logger.debug("INTERCEPTOR_HANDLE_ROUTE: URL=%s, Method=%s", request.url, request.method)
         
         # Check URL protocol - skip unsupported protocols
         if request.url.startswith(CFG.PARAMETERS.UNSUPPORTED_PROTOCOLS):
-            self.api._logger.debug(f"UNSUPPORTED_PROTOCOL: {request.url}")
+            self.api._logger.debug("UNSUPPORTED_PROTOCOL: %s", request.url)
             # Continue request processing without interception
             await route.continue_()
             return
         
+        # Pass common assets straight to the browser when asked to
+        if self.ignore_assets and request.resource_type in CFG.PARAMETERS.ASSET_RESOURCE_TYPES:
+            self.api._logger.debug("ASSET_SKIPPED: %s", request.url)
+            await route.continue_()
+            return
+        
         # Check if there are handlers with request_modify
-        request_modifying_handlers = []
-        for handler in self.handlers:
-            if handler.slug in self.handler_errors:
-                continue
-            
-            # Check if handler hasn't completed all necessary actions
-            if handler.execute.action in (ExecuteAction.MODIFY, ExecuteAction.ALL):
-                if handler.execute.request_modify is not None:
-                    if handler.execute.max_modifications is None or self.handler_modifications[handler.slug] < handler.execute.max_modifications:
-                        request_modifying_handlers.append(handler)
+        request_modifying_handlers = [
+            handler for handler in self.handlers
+            if handler.slug not in self.handler_errors
+            and handler.execute.request_modify is not None
+            and self._can_modify(handler)
+        ]
+
+        # Nothing to modify and no handler prefix matches - let the browser load it as is.
+        # Decided by request URL, so redirects to a matching URL are not seen - opt-in only
+        if self.ignore_unmatched and not request_modifying_handlers and not self._url_may_match(request.url):
+            self.api._logger.debug("URL_NOT_MATCHED: %s", request.url)
+            await route.continue_()
+            return
 
         # Apply request modifications if there are suitable handlers
         modified_request = None
         if request_modifying_handlers:
-            # Create Request object from original request
-            try:
-                method = HttpMethod(request.method) if request.method != "ANY" else HttpMethod.GET
-            except ValueError:
-                method = HttpMethod.GET
-            
-            # Parse parameters from URL
-            from urllib.parse import urlparse, parse_qsl
-            parsed_url = urlparse(request.url)
-            params = dict(parse_qsl(parsed_url.query)) if parsed_url.query else {}
-            
-            # Get request body if exists
-            body = None
-            if hasattr(request, 'post_data') and request.post_data:
-                body = request.post_data
-            
-            modified_request = Request(
-                url=request.url,
-                headers=dict(request.headers) if request.headers else {},
-                params=params,
-                body=body,
-                method=method
-            )
+            modified_request = self._build_request(request)
             
             # Apply modifications from all suitable handlers SEQUENTIALLY
             for handler in request_modifying_handlers:
                 if handler.execute.request_modify is not None:
                     try:
-                        if asyncio.iscoroutinefunction(handler.execute.request_modify):
+                        if self._async_request_modify[handler.slug]:
                             modified_request = await handler.execute.request_modify(modified_request)
                         else:
                             modified_request = handler.execute.request_modify(modified_request)
                         
                         if isinstance(modified_request, Request):
                             self.handler_modifications[handler.slug] += 1
-                            self.api._logger.debug(f"Request modified by handler {handler.slug}: {modified_request.real_url}")
+                            if debug_enabled:
+                                self.api._logger.debug("Request modified by handler %s: %s", handler.slug, modified_request.real_url)
                         else:
                             self.api._logger.warning(f"Handler {handler.slug} request_modify returned non-Request object")
                             modified_request = None
@@ -121,7 +179,7 @@ class MultiRequestInterceptor:
                         modified_request = None
                         break
 
-        response_time = time.time()
+        response_time = time.monotonic()
 
         # Выполняем запрос (оригинальный или модифицированный)
         try:
@@ -157,28 +215,22 @@ class MultiRequestInterceptor:
         mock_response = MockResponse(response.status, response.headers, response.url, request.method)
 
         # Сначала определяем какие хендлеры должны захватить этот ответ
+        # URL не подходит ни под один префикс - проверять хандлеры по одному незачем
+        candidate_handlers = self.handlers if self._url_may_match(response.url) else []
         capturing_handlers = []
-        for handler in self.handlers:
+        for handler in candidate_handlers:
             if handler.slug in self.handler_errors:
                 continue  # Пропускаем хандлеры, которые уже завершились с ошибкой
 
             # Проверяем, не завершил ли хандлер все необходимые действия
-            done_return = True
-            done_modify = True
-            if handler.execute.action in (ExecuteAction.RETURN, ExecuteAction.ALL):
-                if handler.execute.max_responses is None or len(self.handler_results[handler.slug]) < handler.execute.max_responses:
-                    done_return = False
-            if handler.execute.action in (ExecuteAction.MODIFY, ExecuteAction.ALL):
-                if handler.execute.max_modifications is None or self.handler_modifications[handler.slug] < handler.execute.max_modifications:
-                    done_modify = False
-
-            if done_return and done_modify:
+            if self._is_handler_done(handler):
                 continue  # Хендлер завершил все действия
                 
             if handler.should_capture(mock_response, self.base_url):
                 capturing_handlers.append(handler)
-                self.api._logger.debug(CFG.LOGS.HANDLER_WILL_CAPTURE.format(handler_type=handler.expected_content, url=response.url))
-            else:
+                if debug_enabled:
+                    self.api._logger.debug(CFG.LOGS.HANDLER_WILL_CAPTURE.format(handler_type=handler.expected_content, url=response.url))
+            elif debug_enabled:
                 self.api._logger.debug(CFG.LOGS.HANDLER_REJECTED.format(handler_type=handler.expected_content, url=response.url, content_type=response.headers.get('content-type', CFG.PARAMETERS.DEFAULT_CONTENT_TYPE)))
         
         # Если есть хандлеры для захвата, обрабатываем ответ один раз
@@ -187,7 +239,8 @@ class MultiRequestInterceptor:
             modified_response = await self._handle_captured_response(capturing_handlers, response, request, response_time)
         else:
             self._handle_rejected_response(response, request, response_time)
-            self.api._logger.debug(CFG.LOGS.ALL_HANDLERS_REJECTED.format(url=response.url))
+            if debug_enabled:
+                self.api._logger.debug(CFG.LOGS.ALL_HANDLERS_REJECTED.format(url=response.url))
 
         # Проверяем, завершены ли все хандлеры
         self._check_completion()
@@ -226,25 +279,23 @@ class MultiRequestInterceptor:
             # Применяем response_modify ПОСЛЕДОВАТЕЛЬНО от всех хандлеров
             modified_result: Response = result
             for handler in handlers:
-                if handler.execute.action in (ExecuteAction.MODIFY, ExecuteAction.ALL):
-                    if handler.execute.max_modifications is None or self.handler_modifications[handler.slug] < handler.execute.max_modifications:
-                        if handler.execute.response_modify is not None:
-                            try:
-                                if asyncio.iscoroutinefunction(handler.execute.response_modify):
-                                    modification_result = await handler.execute.response_modify(modified_result)
-                                else:
-                                    modification_result = handler.execute.response_modify(modified_result)
-                                
-                                if isinstance(modification_result, Response):
-                                    modified_result = modification_result
-                                    self.handler_modifications[handler.slug] += 1
-                                    self.api._logger.debug(f"Response modified by handler {handler.slug}")
-                                else:
-                                    # Если функция вернула что-то другое, используем предыдущий результат
-                                    self.api._logger.warning(f"Handler {handler.slug} response_modify returned non-Response object")
-                            except Exception as e:
-                                self.api._logger.warning(f"Response modification failed for handler {handler.slug}: {e}")
-                                # Продолжаем с предыдущим результатом
+                if handler.execute.response_modify is not None and self._can_modify(handler):
+                    try:
+                        if self._async_response_modify[handler.slug]:
+                            modification_result = await handler.execute.response_modify(modified_result)
+                        else:
+                            modification_result = handler.execute.response_modify(modified_result)
+                        
+                        if isinstance(modification_result, Response):
+                            modified_result = modification_result
+                            self.handler_modifications[handler.slug] += 1
+                            self.api._logger.debug("Response modified by handler %s", handler.slug)
+                        else:
+                            # Если функция вернула что-то другое, используем предыдущий результат
+                            self.api._logger.warning(f"Handler {handler.slug} response_modify returned non-Response object")
+                    except Exception as e:
+                        self.api._logger.warning(f"Response modification failed for handler {handler.slug}: {e}")
+                        # Продолжаем с предыдущим результатом
 
             # Сохраняем результаты для хандлеров, которые нуждаются в RETURN
             for handler in handlers:
@@ -271,7 +322,7 @@ class MultiRequestInterceptor:
                 url=response.url,
                 error=e
             ))
-            current_time = time.time()
+            current_time = time.monotonic()
             for handler in handlers:
                 self.handler_errors[handler.slug] = HandlerSearchFailed(
                     rejected_responses=self.rejected_responses,
@@ -305,16 +356,7 @@ class MultiRequestInterceptor:
             if handler.slug in self.handler_errors:
                 continue  # Уже завершен с ошибкой
 
-            done_return = True
-            done_modify = True
-            if handler.execute.action in (ExecuteAction.RETURN, ExecuteAction.ALL):
-                if handler.execute.max_responses is None or len(self.handler_results[handler.slug]) < handler.execute.max_responses:
-                    done_return = False
-            if handler.execute.action in (ExecuteAction.MODIFY, ExecuteAction.ALL):
-                if handler.execute.max_modifications is None or self.handler_modifications[handler.slug] < handler.execute.max_modifications:
-                    done_modify = False
-
-            if not (done_return and done_modify):
+            if not self._is_handler_done(handler):
                 all_completed = False
                 break
         
@@ -323,80 +365,49 @@ class MultiRequestInterceptor:
             self.api._logger.info(CFG.LOGS.ALL_HANDLERS_COMPLETED)
             self._complete_all_handlers()
     
+    def _handler_outcome(self, handler: Handler, duration: float) -> Union[HandlerSearchSuccess, HandlerSearchFailed]:
+        """Builds result of a single handler from what it has collected so far"""
+        if self.handler_results[handler.slug] or (
+            handler.execute.action == ExecuteAction.MODIFY and self.handler_modifications[handler.slug] > 0
+        ):
+            return HandlerSearchSuccess(
+                responses=self.handler_results[handler.slug],
+                duration=duration,
+                handler_slug=handler.slug,
+            )
+        # Хандлер не получил ни одного ответа
+        return HandlerSearchFailed(
+            rejected_responses=self.rejected_responses,
+            duration=duration,
+            handler_slug=handler.slug,
+        )
+
     def _complete_all_handlers(self):
         """Завершает работу всех хандлеров"""
         if self.completion_future.done():
             return
             
         # Формируем результат
-        result = []
-        current_time = time.time()
-        
-        for handler in self.handlers:
-            if handler.slug in self.handler_errors:
-                result.append(self.handler_errors[handler.slug])
-            elif self.handler_results[handler.slug] or (
-                handler.execute.action == ExecuteAction.MODIFY and self.handler_modifications[handler.slug] > 0
-            ):
-                duration = current_time - self.start_time
-                result.append(HandlerSearchSuccess(
-                    responses=self.handler_results[handler.slug],
-                    duration=duration,
-                    handler_slug=handler.slug
-                ))
-            else:
-                # Хандлер не получил ни одного ответа
-                duration = current_time - self.start_time
-                error = HandlerSearchFailed(
-                    rejected_responses=self.rejected_responses,
-                    duration=duration,
-                    handler_slug=handler.slug
-                )
-                result.append(error)
+        duration = time.monotonic() - self.start_time
+        result = [
+            self.handler_errors.get(handler.slug) or self._handler_outcome(handler, duration)
+            for handler in self.handlers
+        ]
         
         self.completion_future.set_result(result)
     
     async def wait_for_results(self, timeout: float) -> List[Union[HandlerSearchSuccess, HandlerSearchFailed]]:
         """Ожидает результатов всех хандлеров с таймаутом"""
-        # Устанавливаем таймаут
-        self.timeout_task = asyncio.create_task(asyncio.sleep(timeout))
-        
         # Ожидаем либо завершения всех хандлеров, либо таймаута
-        done, _pending = await asyncio.wait(
-            [self.completion_future, self.timeout_task],
-            return_when=asyncio.FIRST_COMPLETED
-        )
+        done, _pending = await asyncio.wait({self.completion_future}, timeout=timeout)
         
         if self.completion_future in done:
             # Все хандлеры завершились
-            self.timeout_task.cancel()
-            return await self.completion_future
+            return self.completion_future.result()
         else:
             # Таймаут
-            duration = time.time() - self.start_time
+            duration = time.monotonic() - self.start_time
             self.api._logger.warning(CFG.LOGS.TIMEOUT_REACHED.format(base_url=self.base_url, duration=duration))
             
             # Формируем результат с тем, что успели получить
-            result = []
-            for handler in self.handlers:
-                if self.handler_results[handler.slug] or (
-                    handler.execute.action == ExecuteAction.MODIFY and self.handler_modifications[handler.slug] > 0
-                ):
-                    result.append(
-                        HandlerSearchSuccess(
-                            responses=self.handler_results[handler.slug],
-                            duration=duration,
-                            handler_slug=handler.slug,
-                        )
-                    )
-                else:
-                    result.append(
-                        HandlerSearchFailed(
-                            rejected_responses=self.rejected_responses,
-                            duration=duration,
-                            handler_slug=handler.slug,
-                        )
-                    )
-
-            return result
-
+            return [self._handler_outcome(handler, duration) for handler in self.handlers]
@@ -15,33 +15,31 @@ def parse_content_type(content_type: str) -> dict[str, str]:
     if not content_type:
         return {'content_type': '', 'charset': 'utf-8'}
     
-    # Split string into parts and remove extra spaces
-    parts = [p.strip() for p in content_type.split(';')]
+    main_type, has_params, params = content_type.partition(';')
 
     # Main content type always in lowercase
     result = {
-        'content_type': parts[0].lower(),
+        'content_type': main_type.strip().lower(),
         'charset': 'utf-8'  # Set utf-8 as default
     }
+    if not has_params:
+        return result
 
-    # Process additional parameters
-    for part in parts[1:]:
-        if not part:
+    # Process additional parameters in a single pass
+    for part in params.split(';'):
+        key, has_value, value = part.partition('=')
+        key = key.strip().lower()
+        if not has_value:
+            if key:
+                # For parameters without values
+                result[key] = ''
             continue
 
-        if '=' in part:
-            key, value = part.split('=', 1)
-            key = key.strip().lower()
-            # Remove quotes if present
-            value = value.strip().strip('"\'')
-            if key == 'charset':
-                value = value.lower()
-                result['charset'] = value
-            else:
-                result[key] = value
+        # Remove quotes if present
+        value = value.strip().strip('"\'')
+        if key == 'charset':
+            result['charset'] = value.lower()
         else:
-            # For parameters without values
-            result[part.lower()] = ''
+            result[key] = value
     
     return result
-
@@ -1,5 +1,6 @@
 import pytest
 from playwright_interceptor.content_loader import parse_response_data, _remove_csrf_prefixes
+from playwright_interceptor.tools import parse_content_type
 import json
 from io import BytesIO
 
@@ -7,87 +8,83 @@ from io import BytesIO
 class TestCSRFRemoval:
     """Tests for universal CSRF prefix removal"""
     
-    def test_google_style_prefixes(self):
+    @pytest.mark.parametrize("input_data, expected", [
+        (")]}'\\n{\"data\": \"test\"}", {"data": "test"}),
+        (")]}{\"data\": \"test\"}", {"data": "test"}),
+    ])
+    def test_google_style_prefixes(self, input_data, expected):
         """Test Google-style prefixes"""
-        test_cases = [
-            (")]}'\\n{\"data\": \"test\"}", {"data": "test"}),
-            (")]}{\"data\": \"test\"}", {"data": "test"}),
-        ]
-        
-        for input_data, expected in test_cases:
-            result = parse_response_data(input_data, "application/json")
-            assert result == expected, f"Failed for input: {input_data}"
-    
-    def test_facebook_style_prefixes(self):
+        result = parse_response_data(input_data, "application/json")
+        assert result == expected
+    
+    @pytest.mark.parametrize("input_data, expected", [
+        ("while(1);{\"data\": \"test\"}", {"data": "test"}),
+        ("for(;;);{\"data\": \"test\"}", {"data": "test"}),
+    ])
+    def test_facebook_style_prefixes(self, input_data, expected):
         """Test Facebook-style prefixes"""
-        test_cases = [
-            ("while(1);{\"data\": \"test\"}", {"data": "test"}),
-            ("for(;;);{\"data\": \"test\"}", {"data": "test"}),
-        ]
-        
-        for input_data, expected in test_cases:
-            result = parse_response_data(input_data, "application/json")
-            assert result == expected, f"Failed for input: {input_data}"
-    
-    def test_unknown_prefixes(self):
+        result = parse_response_data(input_data, "application/json")
+        assert result == expected
+    
+    @pytest.mark.parametrize("input_data, expected", [
+        ('SECURITY_PREFIX_123{"data": "test"}', {"data": "test"}),
+        ('/*some comment*/{"data": "test"}', {"data": "test"}),
+        ('random_text_here{"data": "test"}', {"data": "test"}),
+        ('12345{"data": "test"}', {"data": "test"}),
+        ('🔒SECURITY🔒{"data": "test"}', {"data": "test"}),
+        (';;;;;;;{"data": "test"}', {"data": "test"}),
+    ])
+    def test_unknown_prefixes(self, input_data, expected):
         """Test unknown CSRF prefixes"""
-        test_cases = [
-            ('SECURITY_PREFIX_123{"data": "test"}', {"data": "test"}),
-            ('/*some comment*/{"data": "test"}', {"data": "test"}),
-            ('random_text_here{"data": "test"}', {"data": "test"}),
-            ('12345{"data": "test"}', {"data": "test"}),
-            ('🔒SECURITY🔒{"data": "test"}', {"data": "test"}),
-            (';;;;;;;{"data": "test"}', {"data": "test"}),
-        ]
-        
-        for input_data, expected in test_cases:
-            result = parse_response_data(input_data, "application/json")
-            assert result == expected, f"Failed for input: {input_data}"
-    
-    def test_array_responses(self):
+        result = parse_response_data(input_data, "application/json")
+        assert result == expected
+    
+    @pytest.mark.parametrize("input_data, expected", [
+        (')]}\\\'\\n[1,2,3]', [1,2,3]),
+        ('prefix[{"a":1},{"b":2}]', [{"a":1},{"b":2}]),
+        (')]}\\\'\\n[[[["test"]]]]', [[[["test"]]]]),
+    ])
+    def test_array_responses(self, input_data, expected):
         """Test arrays with CSRF prefixes"""
-        test_cases = [
-            (')]}\\\'\\n[1,2,3]', [1,2,3]),
-            ('prefix[{"a":1},{"b":2}]', [{"a":1},{"b":2}]),
-            (')]}\\\'\\n[[[["test"]]]]', [[[["test"]]]]),
-        ]
-        
-        for input_data, expected in test_cases:
-            result = parse_response_data(input_data, "application/json")
-            assert result == expected, f"Failed for input: {input_data}"
-    
-    def test_complex_structures(self):
+        result = parse_response_data(input_data, "application/json")
+        assert result == expected
+    
+    @pytest.mark.parametrize("input_data, expected", [
+        (')]}\\\'\\n{"nested": {"data": [1,2,3]}}', {"nested": {"data": [1,2,3]}}),
+        ('prefix{"users": [{"id": 1, "name": "John"}]}', {"users": [{"id": 1, "name": "John"}]}),
+    ])
+    def test_complex_structures(self, input_data, expected):
         """Test complex JSON structures"""
-        test_cases = [
-            (')]}\\\'\\n{"nested": {"data": [1,2,3]}}', {"nested": {"data": [1,2,3]}}),
-            ('prefix{"users": [{"id": 1, "name": "John"}]}', {"users": [{"id": 1, "name": "John"}]}),
-        ]
-        
-        for input_data, expected in test_cases:
-            result = parse_response_data(input_data, "application/json")
-            assert result == expected, f"Failed for input: {input_data}"
-    
-    def test_no_prefix(self):
+        result = parse_response_data(input_data, "application/json")
+        assert result == expected
+    
+    @pytest.mark.parametrize("input_data, expected", [
+        ('{"data": "test"}', {"data": "test"}),
+        ('[1,2,3]', [1,2,3]),
+    ])
+    def test_no_prefix(self, input_data, expected):
         """Test JSON without prefixes"""
-        test_cases = [
-            ('{"data": "test"}', {"data": "test"}),
-            ('[1,2,3]', [1,2,3]),
-        ]
-        
-        for input_data, expected in test_cases:
-            result = parse_response_data(input_data, "application/json")
-            assert result == expected, f"Failed for input: {input_data}"
-    
-    def test_with_spaces(self):
+        result = parse_response_data(input_data, "application/json")
+        assert result == expected
+
+    @pytest.mark.parametrize("input_data, expected", [
+        ('"[1,2]"', '[1,2]'),
+        ('"{\\"a\\": 1}"', '{"a": 1}'),
+        (b'"[1,2]"', '[1,2]'),
+    ])
+    def test_clean_json_string_literal(self, input_data, expected):
+        """Test clean JSON string literal is decoded as is, brackets inside are not a prefix"""
+        result = parse_response_data(input_data, "application/json")
+        assert result == expected
+
+    @pytest.mark.parametrize("input_data, expected", [
+        ('  )]"}\'\\n  {"data": "test"}', {"data": "test"}),
+        ('\\t\\n  prefix{"data": "test"}', {"data": "test"}),
+    ])
+    def test_with_spaces(self, input_data, expected):
         """Test with leading spaces"""
-        test_cases = [
-            ('  )]"}\'\\n  {"data": "test"}', {"data": "test"}),
-            ('\\t\\n  prefix{"data": "test"}', {"data": "test"}),
-        ]
-        
-        for input_data, expected in test_cases:
-            result = parse_response_data(input_data, "application/json")
-            assert result == expected, f"Failed for input: {input_data}"
+        result = parse_response_data(input_data, "application/json")
+        assert result == expected
     
     def test_bytes_input(self):
         """Test with bytes input"""
@@ -154,19 +151,42 @@ class TestResponseDataParsing:
 class TestCSRFPrefixFunction:
     """Tests for internal _remove_csrf_prefixes function"""
     
-    def test_direct_csrf_removal(self):
+    @pytest.mark.parametrize("input_text, expected", [
+        (')]}\\\'\\n{"test": true}', '{"test": true}'),
+        ('while(1);[1,2,3]', '[1,2,3]'),
+        ('prefix{"data": "value"}', '{"data": "value"}'),
+        ('{"clean": "json"}', '{"clean": "json"}'),  # no prefix
+    ])
+    def test_direct_csrf_removal(self, input_text, expected):
         """Direct testing of CSRF removal function"""
-        test_cases = [
-            (')]}\\\'\\n{"test": true}', '{"test": true}'),
-            ('while(1);[1,2,3]', '[1,2,3]'),
-            ('prefix{"data": "value"}', '{"data": "value"}'),
-            ('{"clean": "json"}', '{"clean": "json"}'),  # no prefix
-        ]
-        
-        for input_text, expected in test_cases:
-            result = _remove_csrf_prefixes(input_text)
-            # Parse both to ensure they're equivalent JSON
-            assert json.loads(result) == json.loads(expected)
+        result = _remove_csrf_prefixes(input_text)
+        # Parse both to ensure they're equivalent JSON
+        assert json.loads(result) == json.loads(expected)
+
+
+class TestContentTypeParsing:
+    """Tests for Content-Type header parsing"""
+    
+    @pytest.mark.parametrize("content_type, expected", [
+        ("", {"content_type": "", "charset": "utf-8"}),
+        ("application/json", {"content_type": "application/json", "charset": "utf-8"}),
+        ("Text/HTML", {"content_type": "text/html", "charset": "utf-8"}),
+        ("text/html; charset=UTF-8", {"content_type": "text/html", "charset": "utf-8"}),
+        ("text/html;charset=windows-1251", {"content_type": "text/html", "charset": "windows-1251"}),
+        ('text/plain; charset="ISO-8859-1"', {"content_type": "text/plain", "charset": "iso-8859-1"}),
+        ("text/plain; charset='koi8-r'", {"content_type": "text/plain", "charset": "koi8-r"}),
+        (
+            'multipart/form-data; boundary="AbC"; charset=utf-8',
+            {"content_type": "multipart/form-data", "charset": "utf-8", "boundary": "AbC"},
+        ),
+        ("application/json; Version = 2 ", {"content_type": "application/json", "charset": "utf-8", "version": "2"}),
+        ("text/plain; flag", {"content_type": "text/plain", "charset": "utf-8", "flag": ""}),
+        ("text/plain;; ;", {"content_type": "text/plain", "charset": "utf-8"}),
+        ("text/plain; a=b=c", {"content_type": "text/plain", "charset": "utf-8", "a": "b=c"}),
+    ])
+    def test_parse_content_type(self, content_type, expected):
+        """Test main type, default charset, quotes and extra parameters"""
+        assert parse_content_type(content_type) == expected
 
 
 if __name__ == "__main__":
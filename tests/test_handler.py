@@ -0,0 +1,130 @@
+"""
+Tests for Handler.should_capture matching rules
+"""
+import itertools
+import urllib.parse
+import pytest
+from playwright_interceptor import Handler, ExpectedContentType, HttpMethod
+from playwright_interceptor import config as CFG
+from playwright_interceptor.models import WatcherType
+from playwright_interceptor.tools import parse_content_type
+
+
+BASE_URL = "https://ex.com/p"
+
+
+class FakeResponse:
+    """Minimal stand-in for the object MultiRequestInterceptor passes to should_capture"""
+
+    def __init__(self, url: str, content_type: str = "text/html", method: str = "GET"):
+        self.url = url
+        self.headers = {"content-type": content_type}
+        self.request = type("FakeRequest", (), {"method": method})()
+
+
+@pytest.mark.parametrize("url, is_main", [
+    ("https://ex.com/p", True),
+    ("https://ex.com/", True),
+    ("https://ex.com/p;jsessionid=1", True),
+    ("https://ex.com/p;jsessionid=1?x=1", True),
+    ("https://ex.com/other;jsessionid=1", False),
+    ("https://cdn.ex.com/p;jsessionid=1", False),
+])
+def test_params_in_path_do_not_affect_main_watcher(url, is_main):
+    """`;params` are not part of the path when deciding MAIN vs SIDE"""
+    assert Handler.MAIN().should_capture(FakeResponse(url), BASE_URL) is is_main
+    assert Handler.SIDE().should_capture(FakeResponse(url), BASE_URL) is not is_main
+
+
+def reference_should_capture(handler: Handler, resp, base_url: str) -> bool:
+    """Original, unoptimized should_capture rules the handler must keep matching"""
+    full_url = urllib.parse.unquote(resp.url)
+    ctype = parse_content_type(resp.headers.get("content-type", ""))["content_type"]
+
+    match_method = handler.method == HttpMethod.ANY or resp.request.method == handler.method.value
+    match_content = {
+        ExpectedContentType.JSON: ctype in CFG.NETWORK.JSON_EXTENSIONS,
+        ExpectedContentType.JS: ctype in CFG.NETWORK.JS_EXTENSIONS,
+        ExpectedContentType.CSS: ctype in CFG.NETWORK.CSS_EXTENSIONS,
+        ExpectedContentType.IMAGE: ctype in CFG.NETWORK.IMAGE_EXTENSIONS,
+        ExpectedContentType.VIDEO: ctype in CFG.NETWORK.VIDEO_EXTENSIONS,
+        ExpectedContentType.AUDIO: ctype in CFG.NETWORK.AUDIO_EXTENSIONS,
+        ExpectedContentType.FONT: ctype in CFG.NETWORK.FONT_EXTENSIONS,
+        ExpectedContentType.APPLICATION: ctype in CFG.NETWORK.APPLICATION_EXTENSIONS,
+        ExpectedContentType.ARCHIVE: ctype in CFG.NETWORK.ARCHIVE_EXTENSIONS,
+        ExpectedContentType.TEXT: ctype in CFG.NETWORK.TEXT_EXTENSIONS,
+        ExpectedContentType.ANY: True,
+    }[handler.expected_content]
+
+    base_parsed = urllib.parse.urlparse(base_url)
+    resp_parsed = urllib.parse.urlparse(full_url)
+    is_main = (
+        base_parsed.scheme == resp_parsed.scheme and
+        base_parsed.netloc == resp_parsed.netloc and
+        (resp_parsed.path in ['', '/'] or resp_parsed.path == base_parsed.path)
+    )
+    match_watcher = {
+        WatcherType.ALL: True,
+        WatcherType.MAIN: is_main,
+        WatcherType.SIDE: not is_main,
+    }[handler.watcher]
+
+    return (handler.startswith_url is None or full_url.startswith(handler.startswith_url)) and \
+        match_watcher and match_method and match_content
+
+
+HANDLERS = [
+    Handler(watcher, expected_content, startswith_url, method)
+    for watcher, expected_content, startswith_url, method in itertools.product(
+        list(WatcherType),
+        [ExpectedContentType.ANY, ExpectedContentType.JSON, ExpectedContentType.IMAGE, ExpectedContentType.TEXT],
+        [None, "https://ex.com/api", "https://ex.com/файл"],
+        [HttpMethod.ANY, HttpMethod.POST],
+    )
+]
+
+RESPONSES = [
+    FakeResponse(url, content_type, method)
+    for url, content_type, method in itertools.product(
+        [
+            "https://ex.com/",
+            "https://ex.com/p",
+            "https://ex.com/p;jsessionid=1?x=1",
+            "https://ex.com/api/items",
+            "https://ex.com/api;v=2/items",
+            "https://ex.com/%D1%84%D0%B0%D0%B9%D0%BB/1",
+            "http://ex.com/p",
+            "https://cdn.ex.com/p",
+        ],
+        ["application/json", "image/png; q=1", "Text/HTML; charset=UTF-8", ""],
+        ["GET", "POST"],
+    )
+]
+
+
+@pytest.mark.parametrize("handler", HANDLERS, ids=repr)
+def test_should_capture_matches_reference(handler):
+    """Optimized should_capture gives the same answers as the original rules"""
+    for resp in RESPONSES:
+        expected = reference_should_capture(handler, resp, BASE_URL)
+        assert handler.should_capture(resp, BASE_URL) is expected, \
+            f"{resp.request.method} {resp.url} ({resp.headers['content-type']})"
+
+
+@pytest.mark.parametrize("handler, url, expected", [
+    (Handler.ALL(startswith_url="https://ex.com/файл"), "https://ex.com/%D1%84%D0%B0%D0%B9%D0%BB/1", True),
+    (Handler.ALL(startswith_url="https://ex.com/api"), "https://ex.com/%61pi/items", True),
+    (Handler.ALL(startswith_url="https://ex.com/api"), "https://ex.com/v2/api", False),
+    (Handler.MAIN(expected_content=ExpectedContentType.ANY), "https://ex.com/p", True),
+    (Handler.MAIN(expected_content=ExpectedContentType.ANY), "https://ex.com/q", False),
+    (Handler.SIDE(), "https://cdn.ex.com/p", True),
+    (Handler.SIDE(), "http://ex.com/p", True),
+    (Handler.NONE(), "https://ex.com/p", False),
+])
+def test_should_capture_cases(handler, url, expected):
+    """Percent-encoded prefixes and MAIN/SIDE decisions"""
+    assert handler.should_capture(FakeResponse(url), BASE_URL) is expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
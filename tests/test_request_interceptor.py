@@ -0,0 +1,222 @@
+"""
+Unit tests for MultiRequestInterceptor route handling with fake Playwright objects
+"""
+import asyncio
+import time
+import pytest
+from playwright_interceptor import (
+    NetworkInterceptor,
+    Handler,
+    Execute,
+    HandlerSearchSuccess,
+    HandlerSearchFailed,
+)
+from playwright_interceptor.request_interceptor import MultiRequestInterceptor
+
+
+BASE_URL = "https://ex.com/"
+
+
+class FakeRequest:
+    def __init__(self, url: str, resource_type: str):
+        self.url = url
+        self.method = "GET"
+        self.headers = {"accept": "*/*"}
+        self.post_data = None
+        self.resource_type = resource_type
+
+
+class FakeResponse:
+    def __init__(self, url: str, content_type: str):
+        self.status = 200
+        self.url = url
+        self.headers = {"content-type": content_type}
+
+    async def body(self) -> bytes:
+        return b"{}"
+
+
+class FakeRoute:
+    """Records calls; `redirect_to` emulates route.fetch following a redirect"""
+
+    def __init__(self, url: str, content_type: str = "application/json", resource_type: str = "fetch", redirect_to: str = None):
+        self.request = FakeRequest(url, resource_type)
+        self.content_type = content_type
+        self.redirect_to = redirect_to
+        self.calls = []
+
+    async def fetch(self, **kwargs):
+        self.calls.append("fetch")
+        return FakeResponse(self.redirect_to or kwargs.get("url", self.request.url), self.content_type)
+
+    async def fulfill(self, **kwargs):
+        self.calls.append("fulfill")
+
+    async def continue_(self):
+        self.calls.append("continue")
+
+
+def make_interceptor(handlers, **kwargs) -> MultiRequestInterceptor:
+    return MultiRequestInterceptor(NetworkInterceptor(page=None), handlers, BASE_URL, time.monotonic(), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_unmatched_url_is_fetched_by_default():
+    """Without ignore_unmatched a redirect into the handler prefix is still captured"""
+    handler = Handler.ALL(startswith_url="https://api.ex.com/", slug="api")
+    interceptor = make_interceptor([handler])
+
+    route = FakeRoute("https://ex.com/redir", redirect_to="https://api.ex.com/data")
+    await interceptor.handle_route(route)
+
+    assert route.calls == ["fetch", "fulfill"]
+    assert len(interceptor.handler_results["api"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_unmatched_url_is_recorded_as_rejected_by_default():
+    """Responses matching no prefix stay visible in rejected_responses"""
+    interceptor = make_interceptor([Handler.NONE(slug="none")])
+
+    route = FakeRoute("https://ex.com/page")
+    await interceptor.handle_route(route)
+
+    assert route.calls == ["fetch", "fulfill"]
+    assert [response.url for response in interceptor.rejected_responses] == ["https://ex.com/page"]
+
+
+@pytest.mark.asyncio
+async def test_ignore_unmatched_continues_without_fetch():
+    """With ignore_unmatched a request outside every prefix goes straight to the browser"""
+    handler = Handler.ALL(startswith_url="https://api.ex.com/", slug="api")
+    interceptor = make_interceptor([handler], ignore_unmatched=True)
+
+    skipped = FakeRoute("https://ex.com/page")
+    await interceptor.handle_route(skipped)
+    matched = FakeRoute("https://api.ex.com/data")
+    await interceptor.handle_route(matched)
+
+    assert skipped.calls == ["continue"]
+    assert matched.calls == ["fetch", "fulfill"]
+    assert interceptor.rejected_responses == []
+    assert len(interceptor.handler_results["api"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_ignore_unmatched_keeps_request_modifiers_active():
+    """request_modify applies to every URL, so such handlers disable the shortcut"""
+    modified = []
+
+    def request_modify(request):
+        modified.append(request.url)
+        return request
+
+    handlers = [
+        Handler.ALL(startswith_url="https://api.ex.com/", slug="api"),
+        Handler.ALL(
+            startswith_url="https://api.ex.com/",
+            slug="modifier",
+            execute=Execute.MODIFY(request_modify=request_modify, max_modifications=5),
+        ),
+    ]
+    interceptor = make_interceptor(handlers, ignore_unmatched=True)
+
+    route = FakeRoute("https://ex.com/page")
+    await interceptor.handle_route(route)
+
+    assert route.calls == ["fetch", "fulfill"]
+    assert modified == ["https://ex.com/page"]
+
+
+@pytest.mark.asyncio
+async def test_ignore_assets_continues_images_without_fetch():
+    """With ignore_assets an image is handed back to the browser untouched"""
+    interceptor = make_interceptor([Handler.ALL(slug="any")], ignore_assets=True)
+
+    route = FakeRoute("https://ex.com/logo.png", content_type="image/png", resource_type="image")
+    await interceptor.handle_route(route)
+
+    assert route.calls == ["continue"]
+    assert interceptor.handler_results["any"] == []
+    assert interceptor.rejected_responses == []
+
+
+@pytest.mark.asyncio
+async def test_images_are_fetched_and_offered_to_handlers_by_default():
+    """Without ignore_assets an image goes through handlers as any other response"""
+    interceptor = make_interceptor([Handler.ALL(slug="any")])
+
+    route = FakeRoute("https://ex.com/logo.png", content_type="image/png", resource_type="image")
+    await interceptor.handle_route(route)
+
+    assert route.calls == ["fetch", "fulfill"]
+    assert len(interceptor.handler_results["any"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_url_matcher_skips_handler_checks_for_unmatched_urls(monkeypatch):
+    """Responses outside every prefix are rejected without calling should_capture"""
+    checked = []
+    original = Handler.should_capture
+
+    def spy(self, resp, base_url):
+        checked.append(resp.url)
+        return original(self, resp, base_url)
+
+    monkeypatch.setattr(Handler, "should_capture", spy)
+    handlers = [
+        Handler.ALL(startswith_url="https://api.ex.com/v1", slug="v1", execute=Execute.RETURN(5)),
+        Handler.ALL(startswith_url="https://ex.com/файл", slug="file", execute=Execute.RETURN(5)),
+    ]
+    interceptor = make_interceptor(handlers)
+
+    for url in ["https://ex.com/page", "https://api.ex.com/v1/items", "https://ex.com/%D1%84%D0%B0%D0%B9%D0%BB/1"]:
+        await interceptor.handle_route(FakeRoute(url))
+
+    assert checked == [
+        "https://api.ex.com/v1/items",
+        "https://api.ex.com/v1/items",
+        "https://ex.com/%D1%84%D0%B0%D0%B9%D0%BB/1",
+        "https://ex.com/%D1%84%D0%B0%D0%B9%D0%BB/1",
+    ]
+    assert [response.url for response in interceptor.rejected_responses] == ["https://ex.com/page"]
+    assert len(interceptor.handler_results["v1"]) == 1
+    assert len(interceptor.handler_results["file"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_results_timeout_returns_collected_results():
+    """On timeout handlers report what they have got so far"""
+    handlers = [
+        Handler.ALL(startswith_url="https://ex.com/api", slug="partial", execute=Execute.RETURN(2)),
+        Handler.NONE(slug="none"),
+    ]
+    interceptor = make_interceptor(handlers)
+    await interceptor.handle_route(FakeRoute("https://ex.com/api/items"))
+
+    results = await interceptor.wait_for_results(0.05)
+
+    # Results are built from partial data, handlers never completed
+    assert not interceptor.completion_future.done()
+    assert isinstance(results[0], HandlerSearchSuccess)
+    assert len(results[0].responses) == 1
+    assert isinstance(results[1], HandlerSearchFailed)
+    assert results[1].handler_slug == "none"
+
+
+@pytest.mark.asyncio
+async def test_wait_for_results_returns_before_timeout_when_completed():
+    """Completed handlers do not wait for the timeout"""
+    interceptor = make_interceptor([Handler.ALL(slug="one")])
+    await interceptor.handle_route(FakeRoute("https://ex.com/api/items"))
+
+    # Would hit wait_for timeout if wait_for_results waited for its own timeout
+    results = await asyncio.wait_for(interceptor.wait_for_results(60.0), timeout=1.0)
+
+    assert results is interceptor.completion_future.result()
+    assert isinstance(results[0], HandlerSearchSuccess)
+    assert len(results[0].responses) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])